@@ -14,7 +14,9 @@ import sys
 from revanity import __version__
 from revanity.matcher import MatchMode
 from revanity.generator import VanityGenerator, GeneratorStats
-from revanity.export import prepare_export, save_identity_file, save_identity_text
+from revanity.export import (
+    prepare_export, prepare_output_path, save_identity_file, save_identity_text,
+)
 from revanity.verify import verify_with_rns
 
 
@@ -154,6 +156,14 @@ def main(argv: list[str] = None) -> int:
     if args.dry_run:
         return 0
 
+    if args.output:
+        # Create the output directory once, and fail before searching
+        try:
+            prepare_output_path(args.output)
+        except OSError as e:
+            print(f"Error: cannot create output directory: {e}", file=sys.stderr)
+            return 1
+
     gen.on_progress = lambda stats: progress_callback(stats, args.quiet)
 
     if not args.quiet:
@@ -6,10 +6,29 @@ All constants verified against RNS v1.1.3 source:
   - RNS/Reticulum.py: TRUNCATED_HASHLENGTH = 128
 """
 
+import functools
 import hashlib
+import os
+
+try:
+    from nacl.bindings import crypto_scalarmult_base, crypto_sign_seed_keypair
+    HAS_NACL = True
+except ImportError:
+    HAS_NACL = False
+
+# PyNaCl's raw cffi handle is private API: if a release moves it, search_batch
+# drops to the public nacl.bindings wrappers above, not all the way down to
+# the slower cryptography path.
+try:
+    from nacl._sodium import ffi as _ffi, lib as _sodium
+    HAS_SODIUM_FFI = HAS_NACL
+except ImportError:
+    HAS_SODIUM_FFI = False
+
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives import serialization
+from typing import Callable, Optional
 
 # Verified RNS constants
 NAME_HASH_LENGTH = 80          # bits (10 bytes)
@@ -18,9 +37,7 @@ KEYSIZE = 512                  # bits (64 bytes total keypair)
 
 # Serialization constants cached at module level for performance
 _RAW = serialization.Encoding.Raw
-_RAW_PRV = serialization.PrivateFormat.Raw
 _RAW_PUB = serialization.PublicFormat.Raw
-_NO_ENC = serialization.NoEncryption()
 
 # Precomputed name hashes for known destination types
 LXMF_NAME_HASH = bytes.fromhex("6ec60bc318e2c0f0d908")
@@ -32,9 +49,43 @@ DEST_NAME_HASHES = {
 }
 
 
+class RandomPool:
+    """Hands out CSPRNG bytes from a buffer filled by a single os.urandom call.
+
+    Amortizes the getrandom(2) syscall over many keys. Create one pool per
+    process: a pool copied across fork() would repeat the same bytes.
+    """
+
+    __slots__ = ("chunk", "_buf", "_pos")
+
+    def __init__(self, chunk: int = 65536):
+        self.chunk = chunk
+        self._buf = os.urandom(chunk)
+        self._pos = 0
+
+    def take(self, n: int) -> bytes:
+        """Return the next n random bytes, refilling the buffer when exhausted.
+
+        Returns bytes rather than a memoryview: both the PyNaCl and the
+        cryptography key constructors require bytes. Requests larger than
+        the buffer are served by os.urandom directly.
+        """
+        if n > self.chunk:
+            return os.urandom(n)
+        pos = self._pos
+        if pos + n > self.chunk:
+            self._buf = os.urandom(self.chunk)
+            pos = 0
+        self._pos = pos + n
+        return self._buf[pos:pos + n]
+
+
+@functools.lru_cache(maxsize=64)
 def compute_name_hash(dest_name: str) -> bytes:
     """Compute the 10-byte name hash for a destination type.
 
+    Results are cached, so repeated generators for the same type are free.
+
     Args:
         dest_name: Full destination name, e.g. "lxmf.delivery"
 
@@ -44,33 +95,123 @@ def compute_name_hash(dest_name: str) -> bytes:
     return hashlib.sha256(dest_name.encode("utf-8")).digest()[:NAME_HASH_LENGTH // 8]
 
 
-def generate_and_hash(name_hash: bytes) -> tuple[bytes, bytes, str]:
+for _dest_name in DEST_NAME_HASHES:
+    compute_name_hash(_dest_name)
+del _dest_name
+
+
+def generate_and_hash(name_ctx: "hashlib._Hash") -> tuple[bytes, bytes, bytes]:
     """Generate one identity and compute its destination hash.
 
-    This is the hot-path function called in the inner loop of each worker.
+    Single-shot reference version of the derivation. Workers do not call
+    this; they use search_batch, which does the same computation a batch at
+    a time. Keep the two in agreement.
 
     Args:
-        name_hash: Precomputed 10-byte name hash for the target destination type.
+        name_ctx: SHA-256 context that has already absorbed the 10-byte name
+            hash, e.g. hashlib.sha256(name_hash). It is copied, never updated.
 
     Returns:
-        (private_key_bytes, identity_hash, dest_hex)
+        (private_key_bytes, identity_hash, dest_hash)
         - private_key_bytes: 64 bytes (X25519 prv + Ed25519 prv), RNS-compatible
         - identity_hash: 16 bytes
-        - dest_hex: 32-char lowercase hex string of the destination hash
+        - dest_hash: 16 bytes; hex-encode it only for display
     """
-    x_prv = X25519PrivateKey.generate()
-    e_prv = Ed25519PrivateKey.generate()
-
-    x_pub = x_prv.public_key().public_bytes(_RAW, _RAW_PUB)
-    e_pub = e_prv.public_key().public_bytes(_RAW, _RAW_PUB)
+    # RNS stores the raw 32-byte X25519 private key followed by the 32-byte
+    # Ed25519 seed, so the two random seeds are the private key as-is.
+    seeds = os.urandom(64)
+    x_seed = seeds[:32]
+    e_seed = seeds[32:]
+
+    if HAS_NACL:
+        x_pub = crypto_scalarmult_base(x_seed)
+        e_pub = crypto_sign_seed_keypair(e_seed)[0]
+    else:
+        x_pub = X25519PrivateKey.from_private_bytes(x_seed).public_key().public_bytes(_RAW, _RAW_PUB)
+        e_pub = Ed25519PrivateKey.from_private_bytes(e_seed).public_key().public_bytes(_RAW, _RAW_PUB)
+
+    h = hashlib.sha256(x_pub)
+    h.update(e_pub)
+    identity_hash = h.digest()[:16]
+    h = name_ctx.copy()
+    h.update(identity_hash)
+    dest_hash = h.digest()[:16]
+
+    return seeds, identity_hash, dest_hash
+
+
+def search_batch(
+    name_ctx: "hashlib._Hash",
+    matches: Callable[[bytes], bool],
+    count: int,
+    pool: RandomPool,
+) -> tuple[int, Optional[tuple[bytes, bytes, bytes]]]:
+    """Run up to count attempts in one call and stop at the first match.
+
+    Same computation as generate_and_hash, but with the whole loop inside a
+    single frame and every hot callable bound to a local name, so an attempt
+    costs no Python call or tuple allocation of its own. Seeds for the whole
+    batch are drawn as one contiguous block of 64-byte rows; a row is only
+    copied out as a private key for the matching attempt.
 
-    identity_hash = hashlib.sha256(x_pub + e_pub).digest()[:16]
-    dest_hash = hashlib.sha256(name_hash + identity_hash).digest()[:16]
-
-    prv_bytes = x_prv.private_bytes(_RAW, _RAW_PRV, _NO_ENC)
-    sig_bytes = e_prv.private_bytes(_RAW, _RAW_PRV, _NO_ENC)
+    Args:
+        name_ctx: SHA-256 context that has already absorbed the name hash.
+        matches: Predicate over the raw 16-byte destination hash.
+        count: Maximum number of attempts.
+        pool: RandomPool the key seeds are drawn from.
 
-    return prv_bytes + sig_bytes, identity_hash, dest_hash.hex()
+    Returns:
+        (attempts, hit) where hit is (private_key_bytes, identity_hash, dest_hash)
+        for the first match, or None if no attempt matched.
+    """
+    block = pool.take(64 * count)
+    sha256 = hashlib.sha256
+    copy = name_ctx.copy
+    use_ffi = HAS_SODIUM_FFI
+    use_nacl = HAS_NACL
+    if use_ffi:
+        # Call libsodium through PyNaCl's cffi handle, skipping the wrappers'
+        # per-call output allocation: seeds are read in place from the block
+        # and public keys land in reused buffers that hashlib reads directly.
+        scalarmult_base = _sodium.crypto_scalarmult_base
+        seed_keypair = _sodium.crypto_sign_seed_keypair
+        seeds = _ffi.from_buffer(block)
+        x_out = _ffi.new("unsigned char[32]")
+        e_out = _ffi.new("unsigned char[32]")
+        e_sk = _ffi.new("unsigned char[64]")
+        x_pub = _ffi.buffer(x_out)
+        e_pub = _ffi.buffer(e_out)
+    elif use_nacl:
+        x_from = crypto_scalarmult_base
+        e_from = crypto_sign_seed_keypair
+    else:
+        x_from = X25519PrivateKey.from_private_bytes
+        e_from = Ed25519PrivateKey.from_private_bytes
+
+    for i in range(count):
+        row = 64 * i
+
+        if use_ffi:
+            scalarmult_base(x_out, seeds + row)
+            seed_keypair(e_out, e_sk, seeds + (row + 32))
+        elif use_nacl:
+            x_pub = x_from(block[row:row + 32])
+            e_pub = e_from(block[row + 32:row + 64])[0]
+        else:
+            x_pub = x_from(block[row:row + 32]).public_key().public_bytes(_RAW, _RAW_PUB)
+            e_pub = e_from(block[row + 32:row + 64]).public_key().public_bytes(_RAW, _RAW_PUB)
+
+        h = sha256(x_pub)
+        h.update(e_pub)
+        identity_hash = h.digest()[:16]
+        h = copy()
+        h.update(identity_hash)
+        dest_hash = h.digest()[:16]
+
+        if matches(dest_hash):
+            return i + 1, (block[row:row + 64], identity_hash, dest_hash)
+
+    return count, None
 
 
 def identity_hash_from_pub(x25519_pub: bytes, ed25519_pub: bytes) -> bytes:
@@ -78,6 +219,18 @@ def identity_hash_from_pub(x25519_pub: bytes, ed25519_pub: bytes) -> bytes:
     return hashlib.sha256(x25519_pub + ed25519_pub).digest()[:TRUNCATED_HASHLENGTH // 8]
 
 
-def dest_hash_from_identity_hash(name_hash: bytes, identity_hash: bytes) -> bytes:
-    """Compute the 16-byte destination hash from a name hash and identity hash."""
-    return hashlib.sha256(name_hash + identity_hash).digest()[:TRUNCATED_HASHLENGTH // 8]
+def dest_hash_from_identity_hash(
+    name_hash: bytes,
+    identity_hash: bytes,
+    name_ctx: Optional["hashlib._Hash"] = None,
+) -> bytes:
+    """Compute the 16-byte destination hash from a name hash and identity hash.
+
+    If name_ctx (a SHA-256 context that has already absorbed name_hash) is
+    given, it is copied instead of rehashing name_hash.
+    """
+    if name_ctx is None:
+        return hashlib.sha256(name_hash + identity_hash).digest()[:TRUNCATED_HASHLENGTH // 8]
+    h = name_ctx.copy()
+    h.update(identity_hash)
+    return h.digest()[:TRUNCATED_HASHLENGTH // 8]
@@ -10,20 +10,37 @@ Supported formats:
 
 import os
 import base64
+import hashlib
 from dataclasses import dataclass
+from functools import cached_property
 
 from revanity.core import DEST_NAME_HASHES, dest_hash_from_identity_hash
 
+# SHA-256 contexts that have absorbed each known name hash, copied per export
+_NAME_CTXS = {dt: hashlib.sha256(nh) for dt, nh in DEST_NAME_HASHES.items()}
+
 
 @dataclass
 class ExportedIdentity:
-    """All information about an exported identity."""
+    """All information about an exported identity.
+
+    The private key text encodings are computed on first access.
+    """
     private_key_raw: bytes
     identity_hash_hex: str
     dest_hashes: dict[str, str]     # dest_type -> 32-char hex
-    private_key_hex: str
-    private_key_base32: str
-    private_key_base64: str
+
+    @cached_property
+    def private_key_hex(self) -> str:
+        return self.private_key_raw.hex()
+
+    @cached_property
+    def private_key_base32(self) -> str:
+        return base64.b32encode(self.private_key_raw).decode("ascii")
+
+    @cached_property
+    def private_key_base64(self) -> str:
+        return base64.b64encode(self.private_key_raw).decode("ascii")
 
 
 def prepare_export(
@@ -38,11 +55,15 @@ def prepare_export(
         private_key: 64-byte raw private key.
         identity_hash: 16-byte identity hash.
         dest_type: Primary destination type that was searched.
-        dest_hash_hex: Pre-computed destination hash hex for that type.
+        dest_hash_hex: Pre-computed destination hash hex for that type. When
+            given, that type is not rehashed.
     """
     dest_hashes = {}
     for dt, name_hash in DEST_NAME_HASHES.items():
-        dh = dest_hash_from_identity_hash(name_hash, identity_hash)
+        if dt == dest_type and dest_hash_hex:
+            dest_hashes[dt] = dest_hash_hex
+            continue
+        dh = dest_hash_from_identity_hash(name_hash, identity_hash, _NAME_CTXS[dt])
         dest_hashes[dt] = dh.hex()
 
     if dest_type not in dest_hashes and dest_hash_hex:
@@ -52,25 +73,57 @@ def prepare_export(
         private_key_raw=private_key,
         identity_hash_hex=identity_hash.hex(),
         dest_hashes=dest_hashes,
-        private_key_hex=private_key.hex(),
-        private_key_base32=base64.b32encode(private_key).decode("ascii"),
-        private_key_base64=base64.b64encode(private_key).decode("ascii"),
     )
 
 
+def prepare_output_path(path: str) -> str:
+    """Return the absolute path, creating its parent directory if missing.
+
+    A bare filename is written to the current directory, so no directory
+    check is made for it.
+    """
+    abs_path = os.path.abspath(path)
+    if os.path.dirname(path):
+        parent = os.path.dirname(abs_path)
+        if not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
+    return abs_path
+
+
+def _write_owner_only(abs_path: str, data: bytes) -> None:
+    """Write data to abs_path as a file only its owner can read (POSIX).
+
+    The file is created owner-only from the start, so the key is never
+    readable with default permissions. fchmod covers overwriting an
+    existing file, whose mode O_CREAT leaves untouched. Filesystems that
+    reject chmod (vfat/exFAT, some network mounts) still get the data.
+    """
+    fd = os.open(abs_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        try:
+            os.fchmod(fd, 0o600)
+        except OSError:
+            pass  # The file is already truncated: never lose the key here
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def save_identity_file(private_key: bytes, path: str) -> str:
     """Save identity as raw 64-byte binary file (RNS-compatible format).
 
     Returns the absolute path of the saved file.
     """
-    abs_path = os.path.abspath(path)
-    os.makedirs(os.path.dirname(abs_path) or ".", exist_ok=True)
-    with open(abs_path, "wb") as f:
-        f.write(private_key)
-    try:
-        os.chmod(abs_path, 0o600)
-    except OSError:
-        pass  # Windows: chmod not fully supported
+    abs_path = prepare_output_path(path)
+    if os.name == "nt":
+        # Windows ignores POSIX mode bits and os.open defaults to text mode
+        with open(abs_path, "wb") as f:
+            f.write(private_key)
+        return abs_path
+
+    _write_owner_only(abs_path, private_key)
     return abs_path
 
 
@@ -79,8 +132,7 @@ def save_identity_text(export: ExportedIdentity, path: str) -> str:
 
     Returns the absolute path of the saved file.
     """
-    abs_path = os.path.abspath(path)
-    os.makedirs(os.path.dirname(abs_path) or ".", exist_ok=True)
+    abs_path = prepare_output_path(path)
 
     lines = [
         "# revanity Generated Identity",
@@ -122,10 +174,13 @@ def save_identity_text(export: ExportedIdentity, path: str) -> str:
         "#     identity = RNS.Identity.from_file('path/to/<file>.identity')",
         "#",
     ])
-    with open(abs_path, "w") as f:
-        f.write("\n".join(lines) + "\n")
-    try:
-        os.chmod(abs_path, 0o600)
-    except OSError:
-        pass  # Windows: chmod not fully supported
+    text = "\n".join(lines) + "\n"
+    if os.name == "nt":
+        # Windows ignores POSIX mode bits; keep text mode line endings
+        with open(abs_path, "w") as f:
+            f.write(text)
+        return abs_path
+
+    # The text holds the private key too, so it gets the same treatment
+    _write_owner_only(abs_path, text.encode("utf-8"))
     return abs_path
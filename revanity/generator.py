@@ -4,13 +4,18 @@ Generator orchestrator: manages multiprocessing workers and result collection.
 
 import os
 import time
-from multiprocessing import Process, Queue, Event, Value
+from queue import Empty
+from multiprocessing import Process, Queue, RawArray
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Callable, Optional
 
 from revanity.core import DEST_NAME_HASHES, compute_name_hash
 from revanity.matcher import MatchPattern, MatchMode, validate_hex_pattern, estimate_difficulty
-from revanity.worker import search_worker
+from revanity.worker import COUNTER_STRIDE, STOP_FLAG, counter_slot, pool_worker
+
+# Most results handed out per poll() while a search is still running
+_DRAIN_LIMIT = 64
 
 
 @dataclass
@@ -18,12 +23,17 @@ class GeneratorResult:
     """A single vanity address match."""
     private_key: bytes
     identity_hash: bytes
-    dest_hash_hex: str
+    dest_hash: bytes
     dest_type: str
     elapsed: float
     total_checked: int
     rate: float
 
+    @cached_property
+    def dest_hash_hex(self) -> str:
+        """32-char lowercase hex of dest_hash, encoded on first access."""
+        return self.dest_hash.hex()
+
 
 @dataclass
 class GeneratorStats:
@@ -35,6 +45,147 @@ class GeneratorStats:
     results_found: int = 0
 
 
+class _WorkerPool:
+    """Persistent worker processes that receive search jobs over a task queue.
+
+    Workers are spawned once and reused for every search, so starting a
+    search costs a few queue puts instead of process startup and imports.
+    Each job is posted to every worker's own task queue; a worker runs its job until the
+    shared stop flag is set and then puts its index on the result queue.
+    Hits and these done markers share one queue, so a worker's hit is
+    always read before its done marker. A worker that dies without sending
+    its marker (SIGKILL, OOM killer) is dropped from the job instead.
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = num_workers
+        self.result_queue = Queue()
+        self.shared = RawArray("Q", counter_slot(num_workers))
+        # One task queue per worker, so each worker takes exactly one task
+        # per job and the done markers to wait for are known by index
+        self._tasks = [Queue() for _ in range(num_workers)]
+        self._hits: list[tuple] = []
+        self._busy: set[int] = set()  # indices of workers still on the job
+        self.job = 0
+        self._workers: list[Process] = []
+
+        for i in range(num_workers):
+            p = Process(
+                target=pool_worker,
+                args=(
+                    i,
+                    self._tasks[i],
+                    self.result_queue,
+                    self.shared,
+                ),
+                daemon=True,
+                name=f"revanity-worker-{i}",
+            )
+            p.start()
+            self._workers.append(p)
+
+    def is_alive(self) -> bool:
+        return all(w.is_alive() for w in self._workers)
+
+    def _pump(self) -> None:
+        """Move everything waiting on the result queue into _hits/_busy."""
+        while True:
+            try:
+                item = self.result_queue.get_nowait()
+            except Empty:
+                return
+            if isinstance(item, int):
+                self._busy.discard(item)
+            else:
+                self._hits.append(item)
+
+    def is_idle(self) -> bool:
+        """True once every worker has finished the current job.
+
+        Once this returns True, every hit of the job is in take_hits().
+        """
+        if self._busy:
+            # Check for dead workers before reading the queue: a process
+            # that exited normally has flushed its puts by then, so its hit
+            # is still collected below
+            dead = {i for i in self._busy if not self._workers[i].is_alive()}
+            self._pump()
+            self._busy -= dead
+        return not self._busy
+
+    def take_hits(self, limit: Optional[int] = None) -> list[tuple]:
+        """Remove and return up to limit (all if None) buffered hits."""
+        self._pump()
+        hits = self._hits[:limit]
+        del self._hits[:limit]
+        return hits
+
+    def submit(self, name_hash: bytes, pattern: MatchPattern) -> int:
+        """Post a search job to every worker and return its job number.
+
+        The pool must be idle. Hits of the previous job that were never
+        collected are dropped.
+        """
+        for i in range(len(self.shared)):
+            self.shared[i] = 0  # clears the stop flag and every counter
+        self._hits.clear()
+        for tasks in self._tasks:
+            tasks.put((name_hash, pattern))
+        self._busy = set(range(self.num_workers))
+        self.job += 1
+        return self.job
+
+    def stop(self, timeout: float) -> bool:
+        """Signal the current job to stop and wait for it. Returns True if idle."""
+        self.shared[STOP_FLAG] = 1
+        deadline = time.time() + timeout
+        while not self.is_idle():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def total_checked(self) -> int:
+        """Sum the per-worker keys-checked counters."""
+        return sum(self.shared[COUNTER_STRIDE::COUNTER_STRIDE])
+
+    def shutdown(self) -> None:
+        """Stop all worker processes for good."""
+        self.shared[STOP_FLAG] = 1
+        for tasks in self._tasks:
+            tasks.put(None)
+        for w in self._workers:
+            w.join(timeout=2.0)
+            if w.is_alive():
+                w.terminate()
+        self._workers = []
+        self._busy.clear()
+
+
+_pool: Optional[_WorkerPool] = None
+
+
+def _get_pool(num_workers: int) -> _WorkerPool:
+    """Return the shared worker pool, (re)creating it if its size changed."""
+    global _pool
+    if _pool is not None and (_pool.num_workers != num_workers or not _pool.is_alive()):
+        if not _pool.is_idle():
+            raise RuntimeError("Another search is already running")
+        _pool.shutdown()
+        _pool = None
+    if _pool is None:
+        _pool = _WorkerPool(num_workers)
+    return _pool
+
+
+def _discard_pool(pool: _WorkerPool) -> None:
+    """Shut down a pool whose workers did not stop, so the next search respawns."""
+    global _pool
+    pool.shutdown()
+    if _pool is pool:
+        _pool = None
+
+
 class VanityGenerator:
     """Orchestrates parallel vanity address generation.
 
@@ -85,45 +236,34 @@ class VanityGenerator:
         self.on_complete: Optional[Callable[[], None]] = None
 
         # Internal state
-        self._workers: list[Process] = []
-        self._result_queue: Optional[Queue] = None
-        self._stop_event: Optional[Event] = None
-        self._counter: Optional[Value] = None
+        self._pool: Optional[_WorkerPool] = None
+        self._job = 0
         self._start_time: float = 0
         self._results: list[GeneratorResult] = []
         self._is_running = False
 
+    def _total_checked(self) -> int:
+        """Sum the per-worker keys-checked counters."""
+        return self._pool.total_checked() if self._pool else 0
+
     def get_difficulty(self) -> dict:
         """Get difficulty estimate for the current pattern."""
         return estimate_difficulty(self.match_pattern)
 
     def start(self) -> None:
-        """Start worker processes (non-blocking)."""
+        """Hand the search to the worker pool (non-blocking)."""
         if self._is_running:
             raise RuntimeError("Generator is already running")
 
-        self._result_queue = Queue()
-        self._stop_event = Event()
-        self._counter = Value("Q", 0)
+        pool = _get_pool(self.num_workers)
+        if not pool.is_idle():
+            raise RuntimeError("Another search is already running")
+
+        self._pool = pool
         self._start_time = time.time()
         self._results = []
         self._is_running = True
-
-        for i in range(self.num_workers):
-            p = Process(
-                target=search_worker,
-                args=(
-                    self.name_hash,
-                    self.match_pattern,
-                    self._result_queue,
-                    self._stop_event,
-                    self._counter,
-                ),
-                daemon=True,
-                name=f"revanity-worker-{i}",
-            )
-            p.start()
-            self._workers.append(p)
+        self._job = pool.submit(self.name_hash, self.match_pattern)
 
     def poll(self) -> GeneratorStats:
         """Poll for progress and results. Call periodically from UI/CLI."""
@@ -133,31 +273,33 @@ class VanityGenerator:
             stats.is_running = False
             return stats
 
-        # Drain result queue
-        while not self._result_queue.empty():
-            try:
-                prv_bytes, identity_hash, dest_hex = self._result_queue.get_nowait()
-                elapsed = time.time() - self._start_time
-                total = self._counter.value
-
-                result = GeneratorResult(
-                    private_key=prv_bytes,
-                    identity_hash=identity_hash,
-                    dest_hash_hex=dest_hex,
-                    dest_type=self.dest_type,
-                    elapsed=elapsed,
-                    total_checked=total,
-                    rate=total / elapsed if elapsed > 0 else 0,
-                )
-                self._results.append(result)
+        # Check for completion before draining, so hits pushed by the last
+        # workers to finish are still collected below; once finished, take
+        # them all, since nothing drains the pool after the final poll
+        finished = self._pool.is_idle()
+
+        for prv_bytes, identity_hash, dest_hash in self._pool.take_hits(
+            None if finished else _DRAIN_LIMIT
+        ):
+            elapsed = time.time() - self._start_time
+            total = self._total_checked()
+
+            result = GeneratorResult(
+                private_key=prv_bytes,
+                identity_hash=identity_hash,
+                dest_hash=dest_hash,
+                dest_type=self.dest_type,
+                elapsed=elapsed,
+                total_checked=total,
+                rate=total / elapsed if elapsed > 0 else 0,
+            )
+            self._results.append(result)
 
-                if self.on_result:
-                    self.on_result(result)
-            except Exception:
-                break
+            if self.on_result:
+                self.on_result(result)
 
         elapsed = time.time() - self._start_time
-        total = self._counter.value
+        total = self._total_checked()
 
         stats.total_checked = total
         stats.elapsed = elapsed
@@ -168,8 +310,8 @@ class VanityGenerator:
         if self.on_progress:
             self.on_progress(stats)
 
-        # Check if workers have finished (stop_event was set by a worker finding a match)
-        if self._stop_event.is_set() and all(not w.is_alive() for w in self._workers):
+        # Check if workers have finished (the stop flag was set by a worker finding a match)
+        if finished:
             self._is_running = False
             if self.on_complete:
                 self.on_complete()
@@ -177,35 +319,33 @@ class VanityGenerator:
         return stats
 
     def stop(self) -> list[GeneratorResult]:
-        """Stop all workers and return collected results."""
-        if self._stop_event:
-            self._stop_event.set()
+        """Stop the search and return collected results.
 
-        for w in self._workers:
-            w.join(timeout=2.0)
-            if w.is_alive():
-                w.terminate()
-
-        # Final drain of result queue
-        if self._result_queue:
-            while not self._result_queue.empty():
-                try:
-                    prv_bytes, identity_hash, dest_hex = self._result_queue.get_nowait()
-                    elapsed = time.time() - self._start_time
-                    total = self._counter.value if self._counter else 0
-                    self._results.append(GeneratorResult(
-                        private_key=prv_bytes,
-                        identity_hash=identity_hash,
-                        dest_hash_hex=dest_hex,
-                        dest_type=self.dest_type,
-                        elapsed=elapsed,
-                        total_checked=total,
-                        rate=total / elapsed if elapsed > 0 else 0,
-                    ))
-                except Exception:
-                    break
+        Worker processes stay alive for the next search; they are only
+        terminated if they fail to stop in time.
+        """
+        # The pool may already be running someone else's job
+        if self._pool is None or self._pool.job != self._job:
+            self._is_running = False
+            return self._results
+
+        if self._is_running and not self._pool.stop(timeout=2.0):
+            _discard_pool(self._pool)
+
+        # Final drain, also after poll() saw the job finish
+        for prv_bytes, identity_hash, dest_hash in self._pool.take_hits():
+            elapsed = time.time() - self._start_time
+            total = self._total_checked()
+            self._results.append(GeneratorResult(
+                private_key=prv_bytes,
+                identity_hash=identity_hash,
+                dest_hash=dest_hash,
+                dest_type=self.dest_type,
+                elapsed=elapsed,
+                total_checked=total,
+                rate=total / elapsed if elapsed > 0 else 0,
+            ))
 
-        self._workers = []
         self._is_running = False
         return self._results
 
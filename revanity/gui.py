@@ -7,6 +7,9 @@ with real-time progress, difficulty estimation, and result export.
 
 import os
 import sys
+import time
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 try:
@@ -21,7 +24,38 @@ from revanity.generator import VanityGenerator, GeneratorResult, GeneratorStats
 from revanity.export import prepare_export, save_identity_file, save_identity_text, ExportedIdentity
 from revanity.verify import verify_with_rns
 
-POLL_MS = 200
+# The poll loop runs every POLL_MIN_MS while results are arriving and
+# backs off by POLL_BACKOFF per poll that brought none, up to POLL_MAX_MS.
+# Below POLL_MAX_MS it also waits at least 20x the time the last poll took,
+# which keeps the Tk thread under ~5% busy.
+POLL_MIN_MS = 200
+POLL_MAX_MS = 500
+POLL_BACKOFF = 1.25
+
+# Quiet period after the last keystroke before the difficulty label updates.
+DIFFICULTY_DEBOUNCE_MS = 150
+
+# How often to check whether a background RNS verification has finished.
+VERIFY_POLL_MS = 50
+
+# Unit tables for the stats line: a value below _X_THRESHOLDS[i] is shown
+# as value * mul / div with the format string from _X_UNITS[i].  Dividing
+# (rather than multiplying by a reciprocal) rounds exactly like the plain
+# "value / 60" expressions these replace.
+_TIME_THRESHOLDS = (1, 60, 3600, 86400)
+_TIME_UNITS = (
+    (1000, 1, "{:.0f}ms"),
+    (1, 1, "{:.1f}s"),
+    (1, 60, "{:.1f}m"),
+    (1, 3600, "{:.1f}h"),
+    (1, 86400, "{:.1f}d"),
+)
+_RATE_THRESHOLDS = (1000, 1_000_000)
+_RATE_UNITS = (
+    (1, 1, "{:.0f}"),
+    (1, 1000, "{:.1f}K"),
+    (1, 1_000_000, "{:.2f}M"),
+)
 
 
 class ReVanityApp(ctk.CTk):
@@ -37,44 +71,61 @@ class ReVanityApp(ctk.CTk):
 
         self.generator: Optional[VanityGenerator] = None
         self.current_results: list[GeneratorResult] = []
-        self.current_export: Optional[ExportedIdentity] = None
+        self._exports: list[ExportedIdentity] = []  # parallel to current_results
+        self._display_chunks: list[str] = []  # results shown by the next poll
         self._radio_buttons: list = []
-
+        self._click_targets: set = set()
+        self._click_ran = False  # a routed command ran during this click
+        self._difficulty_after = None
+        self._poll_after = None
+        self._poll_ms = POLL_MIN_MS
+        # RNS verification takes tens of ms; run it off the Tk thread.
+        self._verify_executor = ThreadPoolExecutor(max_workers=1)
+        self._verify_future: Optional[Future] = None
+
+        self.bind_all("<ButtonRelease-1>", self._global_release, add="+")
         self._build_ui()
         self._update_difficulty()
 
     # ── Click-target fixes ───────────────────────────────────────────
     # CustomTkinter on macOS has a known bug where clicking on the
     # text label inside a CTkButton or CTkRadioButton does not fire
-    # the command.  We work around this by binding <Button-1> on
-    # every internal child widget so clicks propagate correctly.
-
-    @staticmethod
-    def _fix_button_click(btn, command):
-        """Bind <Button-1> on all child widgets of a CTkButton."""
-        def handler(event):
-            if str(btn.cget("state")) == "disabled":
-                return
+    # the command.  Buttons and radio buttons keep their own command=
+    # (for CustomTkinter's cursor and press/release handling), wrapped so
+    # we can tell it ran.  A single application-wide <ButtonRelease-1>
+    # binding, which fires after the widget's own bindings, invokes the
+    # registered widget under the pointer only if its command did not.
+
+    def _routed(self, command):
+        """Wrap a button command so _global_release knows it already ran."""
+        def run():
+            self._click_ran = True
             command()
-        for child in btn.winfo_children():
-            child.bind("<Button-1>", handler)
-            for grandchild in child.winfo_children():
-                grandchild.bind("<Button-1>", handler)
+        return run
 
-    @staticmethod
-    def _fix_radio_click(rb, variable, value, command):
-        """Bind <Button-1> on all child widgets of a CTkRadioButton."""
-        def handler(event):
-            if str(rb.cget("state")) == "disabled":
-                return
-            variable.set(value)
-            rb.select()
-            if command:
-                command()
-        for child in rb.winfo_children():
-            child.bind("<Button-1>", handler)
-            for grandchild in child.winfo_children():
-                grandchild.bind("<Button-1>", handler)
+    def _global_release(self, event):
+        """Invoke the registered widget containing event.widget, if missed."""
+        ran, self._click_ran = self._click_ran, False
+        if ran:
+            return
+        widget = event.widget
+        while widget is not None and widget not in self._click_targets:
+            widget = getattr(widget, "master", None)
+        if widget is None:
+            return
+        # Releasing after dragging off the widget cancels the click
+        x = event.x_root - widget.winfo_rootx()
+        y = event.y_root - widget.winfo_rooty()
+        if 0 <= x < widget.winfo_width() and 0 <= y < widget.winfo_height():
+            widget.invoke()  # no-op while disabled
+
+    def _fix_button_click(self, btn):
+        """Route missed clicks anywhere inside a CTkButton to its command."""
+        self._click_targets.add(btn)
+
+    def _fix_radio_click(self, rb):
+        """Route missed clicks anywhere inside a CTkRadioButton to selecting it."""
+        self._click_targets.add(rb)
 
     # ── UI Construction ──────────────────────────────────────────────
 
@@ -142,11 +193,11 @@ class ReVanityApp(ctk.CTk):
             rb = ctk.CTkRadioButton(
                 mode_frame, text=m.capitalize(),
                 variable=self.mode_var, value=m,
-                command=self._update_difficulty,
+                command=self._routed(self._update_difficulty),
             )
             rb.pack(side="left", padx=6)
             self._radio_buttons.append(rb)
-            self._fix_radio_click(rb, self.mode_var, m, self._update_difficulty)
+            self._fix_radio_click(rb)
 
         row += 1
 
@@ -155,7 +206,7 @@ class ReVanityApp(ctk.CTk):
             row=row, column=0, sticky="w", padx=(15, 5), pady=6
         )
         self.pattern_var = ctk.StringVar()
-        self.pattern_var.trace_add("write", lambda *_: self._update_difficulty())
+        self.pattern_var.trace_add("write", lambda *_: self._schedule_difficulty())
         self.pattern_entry = ctk.CTkEntry(
             frame, textvariable=self.pattern_var,
             placeholder_text="e.g. dead, cafe, beef (hex characters)",
@@ -212,20 +263,20 @@ class ReVanityApp(ctk.CTk):
         inner.pack()
 
         self.start_btn = ctk.CTkButton(
-            inner, text="Start Search", command=self._start_search,
+            inner, text="Start Search", command=self._routed(self._start_search),
             width=160, height=40,
             font=ctk.CTkFont(size=15, weight="bold"),
         )
         self.start_btn.pack(side="left", padx=(0, 10))
-        self._fix_button_click(self.start_btn, self._start_search)
+        self._fix_button_click(self.start_btn)
 
         self.stop_btn = ctk.CTkButton(
-            inner, text="Stop", command=self._stop_search,
+            inner, text="Stop", command=self._routed(self._stop_search),
             width=100, height=40, state="disabled",
             fg_color="#555555", hover_color="#666666",
         )
         self.stop_btn.pack(side="left")
-        self._fix_button_click(self.stop_btn, self._stop_search)
+        self._fix_button_click(self.stop_btn)
 
     def _build_progress(self):
         frame = ctk.CTkFrame(self)
@@ -270,25 +321,25 @@ class ReVanityApp(ctk.CTk):
         btn_frame.grid(row=2, column=0, sticky="ew", padx=15, pady=(2, 10))
 
         self.save_btn = ctk.CTkButton(
-            btn_frame, text="Save .identity", command=self._save_identity,
+            btn_frame, text="Save .identity", command=self._routed(self._save_identity),
             state="disabled", width=130,
         )
         self.save_btn.pack(side="left", padx=(0, 8))
-        self._fix_button_click(self.save_btn, self._save_identity)
+        self._fix_button_click(self.save_btn)
 
         self.copy_btn = ctk.CTkButton(
-            btn_frame, text="Copy Address", command=self._copy_address,
+            btn_frame, text="Copy Address", command=self._routed(self._copy_address),
             state="disabled", width=130,
         )
         self.copy_btn.pack(side="left", padx=(0, 8))
-        self._fix_button_click(self.copy_btn, self._copy_address)
+        self._fix_button_click(self.copy_btn)
 
         self.verify_btn = ctk.CTkButton(
-            btn_frame, text="Verify with RNS", command=self._verify_result,
+            btn_frame, text="Verify with RNS", command=self._routed(self._verify_result),
             state="disabled", width=130,
         )
         self.verify_btn.pack(side="left")
-        self._fix_button_click(self.verify_btn, self._verify_result)
+        self._fix_button_click(self.verify_btn)
 
     # ── Callbacks ────────────────────────────────────────────────────
 
@@ -303,7 +354,14 @@ class ReVanityApp(ctk.CTk):
         cpu = os.cpu_count() or 4
         self.workers_label.configure(text=f"{int(value)} / {cpu}")
 
+    def _schedule_difficulty(self):
+        """Debounce difficulty updates while the pattern is being typed."""
+        if self._difficulty_after:
+            self.after_cancel(self._difficulty_after)
+        self._difficulty_after = self.after(DIFFICULTY_DEBOUNCE_MS, self._update_difficulty)
+
     def _update_difficulty(self):
+        self._difficulty_after = None
         pattern = self.pattern_var.get().strip()
         if not pattern:
             self.difficulty_label.configure(text="Enter a hex pattern above to begin")
@@ -385,7 +443,8 @@ class ReVanityApp(ctk.CTk):
         self.progress_bar.configure(mode="indeterminate")
         self.progress_bar.start()
         self.current_results = []
-        self.current_export = None
+        self._exports = []
+        self._display_chunks = []
         self._clear_results()
 
         diff = self.generator.get_difficulty()
@@ -401,13 +460,19 @@ class ReVanityApp(ctk.CTk):
                 f"Using {self.generator.num_workers} worker processes...\n\n"
             )
 
+        self.generator.on_result = self._on_result
         self.generator.start()
-        self._poll()
+        # First poll once Tk has drawn the locked UI; later polls are only
+        # scheduled while the search runs, so an idle window has no timer.
+        self._poll_ms = POLL_MIN_MS
+        self._poll_after = self.after_idle(self._poll)
 
     def _poll(self):
+        self._poll_after = None
         if self.generator is None:
             return
 
+        t0 = time.perf_counter()
         stats = self.generator.poll()
 
         elapsed_str = self._format_time(stats.elapsed)
@@ -418,23 +483,38 @@ class ReVanityApp(ctk.CTk):
                  f"Elapsed: {elapsed_str}"
         )
 
-        if stats.results_found > len(self.current_results):
-            new_results = self.generator.results[len(self.current_results):]
-            for result in new_results:
-                self.current_results.append(result)
-                export = prepare_export(
-                    result.private_key, result.identity_hash,
-                    result.dest_type, result.dest_hash_hex,
-                )
-                self.current_export = export
-                self._display_result(result, export)
+        if self._display_chunks:
+            # One insert and one redraw per poll, however many results arrived
+            self._append_result("".join(self._display_chunks))
+            self._display_chunks.clear()
+            self.results_text.update_idletasks()
+            self._poll_ms = POLL_MIN_MS
+        else:
+            self._poll_ms = min(POLL_MAX_MS, self._poll_ms * POLL_BACKOFF)
 
         if stats.is_running:
-            self.after(POLL_MS, self._poll)
+            work_ms = (time.perf_counter() - t0) * 1000
+            next_ms = min(POLL_MAX_MS, max(int(self._poll_ms), int(work_ms * 20)))
+            self._poll_after = self.after(next_ms, self._poll)
         else:
             self._search_finished()
 
+    def _on_result(self, result: GeneratorResult):
+        """Generator callback, run from poll() for each new match."""
+        export = prepare_export(
+            result.private_key, result.identity_hash,
+            result.dest_type, result.dest_hash_hex,
+        )
+        self.current_results.append(result)
+        self._exports.append(export)
+        self._display_chunks.append(self._format_result(result, export))
+
     def _stop_search(self):
+        # Cancel the pending poll, which would otherwise see the stopped
+        # generator and finish the search a second time.
+        if self._poll_after:
+            self.after_cancel(self._poll_after)
+            self._poll_after = None
         if self.generator:
             self.generator.stop()
         self._search_finished()
@@ -450,7 +530,8 @@ class ReVanityApp(ctk.CTk):
         if self.current_results:
             self.save_btn.configure(state="normal")
             self.copy_btn.configure(state="normal")
-            self.verify_btn.configure(state="normal")
+            if self._verify_future is None:
+                self.verify_btn.configure(state="normal")
             self._append_result("\nSearch complete.\n")
         else:
             self._append_result("\nSearch stopped (no match found).\n")
@@ -468,7 +549,7 @@ class ReVanityApp(ctk.CTk):
         self.results_text.configure(state="disabled")
         self.results_text.see("end")
 
-    def _display_result(self, result: GeneratorResult, export: ExportedIdentity):
+    def _format_result(self, result: GeneratorResult, export: ExportedIdentity) -> str:
         lines = [
             "=" * 52,
             "  MATCH FOUND",
@@ -484,29 +565,19 @@ class ReVanityApp(ctk.CTk):
             "=" * 52,
             "",
         ])
-        self._append_result("\n".join(lines))
+        return "\n".join(lines)
 
     @staticmethod
     def _format_time(seconds: float) -> str:
-        if seconds < 1:
-            return f"{seconds * 1000:.0f}ms"
-        elif seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            return f"{seconds / 60:.1f}m"
-        elif seconds < 86400:
-            return f"{seconds / 3600:.1f}h"
-        else:
-            return f"{seconds / 86400:.1f}d"
+        i = bisect_right(_TIME_THRESHOLDS, seconds)
+        mul, div, fmt = _TIME_UNITS[i]
+        return fmt.format(seconds * mul / div)
 
     @staticmethod
     def _format_rate(rate: float) -> str:
-        if rate < 1000:
-            return f"{rate:.0f}"
-        elif rate < 1_000_000:
-            return f"{rate / 1000:.1f}K"
-        else:
-            return f"{rate / 1_000_000:.2f}M"
+        i = bisect_right(_RATE_THRESHOLDS, rate)
+        mul, div, fmt = _RATE_UNITS[i]
+        return fmt.format(rate * mul / div)
 
     # ── Action Buttons ───────────────────────────────────────────────
 
@@ -525,10 +596,7 @@ class ReVanityApp(ctk.CTk):
         )
         if path:
             save_identity_file(result.private_key, path)
-            export = self.current_export or prepare_export(
-                result.private_key, result.identity_hash,
-                result.dest_type, result.dest_hash_hex,
-            )
+            export = self._exports[-1]
             txt_path = path.rsplit(".", 1)[0] + ".txt"
             save_identity_text(export, txt_path)
             self._append_result(f"\nSaved: {path}\nInfo:  {txt_path}\n")
@@ -542,24 +610,36 @@ class ReVanityApp(ctk.CTk):
         self._append_result("Address copied to clipboard.\n")
 
     def _verify_result(self):
-        if not self.current_results:
+        if not self.current_results or self._verify_future is not None:
             return
         result = self.current_results[-1]
-        export = self.current_export or prepare_export(
-            result.private_key, result.identity_hash,
-            result.dest_type, result.dest_hash_hex,
-        )
-        v = verify_with_rns(
+        export = self._exports[-1]
+        self.verify_btn.configure(state="disabled")
+        self._verify_future = self._verify_executor.submit(
+            verify_with_rns,
             result.private_key,
             export.identity_hash_hex,
             result.dest_hash_hex,
             dest_name=result.dest_type,
         )
+        self.after(VERIFY_POLL_MS, self._poll_verify, result.dest_hash_hex)
+
+    def _poll_verify(self, dest_hex: str):
+        # The outcome names its address: a new search may have replaced
+        # the result that was being verified.
+        future = self._verify_future
+        if not future.done():
+            self.after(VERIFY_POLL_MS, self._poll_verify, dest_hex)
+            return
+        self._verify_future = None
+        if self.current_results and not (self.generator and self.generator.is_running):
+            self.verify_btn.configure(state="normal")
+        v = future.result()
         if v["rns_available"]:
             id_ok = "PASS" if v["identity_hash_match"] else "FAIL"
             dest_ok = "PASS" if v["dest_hash_match"] else "FAIL"
             self._append_result(
-                f"\nRNS Verification:\n"
+                f"\nRNS Verification of {dest_hex}:\n"
                 f"  Identity hash: {id_ok}\n"
                 f"  Dest hash:     {dest_ok}\n"
             )
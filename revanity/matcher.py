@@ -1,9 +1,10 @@
 """Pattern matching strategies for vanity address search."""
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 
 class MatchMode(Enum):
@@ -33,26 +34,68 @@ class MatchPattern:
 
 
 class CompiledPattern:
-    """Worker-local compiled pattern for fast matching."""
+    """Worker-local compiled pattern for fast matching.
 
-    __slots__ = ("mode", "pattern", "_regex")
+    matches(hex_addr) tests a 32-char lowercase hex address and
+    matches_bytes(dest_hash) a raw 16-byte destination hash. Both are
+    closures specialized for the mode when the pattern is compiled, so the
+    per-candidate call does no mode dispatch.
+    """
+
+    __slots__ = ("mode", "pattern", "_regex", "matches", "matches_bytes")
 
     def __init__(self, mode: MatchMode, pattern: str, regex: Optional[re.Pattern]):
         self.mode = mode
         self.pattern = pattern
         self._regex = regex
-
-    def matches(self, hex_addr: str) -> bool:
-        """Test if a 32-char lowercase hex address matches this pattern."""
-        if self.mode == MatchMode.PREFIX:
-            return hex_addr.startswith(self.pattern)
-        elif self.mode == MatchMode.SUFFIX:
-            return hex_addr.endswith(self.pattern)
-        elif self.mode == MatchMode.CONTAINS:
-            return self.pattern in hex_addr
-        elif self.mode == MatchMode.REGEX:
-            return bool(self._regex.search(hex_addr))
-        return False
+        self.matches = _hex_matcher(mode, pattern, regex)
+        self.matches_bytes = _bytes_matcher(mode, pattern, self.matches)
+
+
+def _hex_matcher(
+    mode: MatchMode, pattern: str, regex: Optional[re.Pattern]
+) -> Callable[[str], bool]:
+    """Build the hex-address predicate for a mode."""
+    if mode == MatchMode.PREFIX:
+        return lambda hex_addr: hex_addr.startswith(pattern)
+    elif mode == MatchMode.SUFFIX:
+        return lambda hex_addr: hex_addr.endswith(pattern)
+    elif mode == MatchMode.CONTAINS:
+        return lambda hex_addr: pattern in hex_addr
+    elif mode == MatchMode.REGEX:
+        search = regex.search
+        return lambda hex_addr: bool(search(hex_addr))
+    return lambda hex_addr: False
+
+
+def _bytes_matcher(
+    mode: MatchMode, pattern: str, matches: Callable[[str], bool]
+) -> Callable[[bytes], bool]:
+    """Build the raw dest-hash predicate for a mode.
+
+    A hex prefix/suffix is split into whole bytes plus the odd nibble (the
+    one after a prefix, or the one before a suffix) so it can be compared
+    without hex-encoding the hash. Contains and regex patterns fall back to
+    the hex predicate.
+    """
+    if mode == MatchMode.PREFIX:
+        whole = len(pattern) // 2 * 2
+        head = bytes.fromhex(pattern[:whole])
+        if whole == len(pattern):
+            # Byte-aligned: one fixed-length slice compare
+            n = len(head)
+            return lambda dest_hash: dest_hash[:n] == head
+        at, nibble = whole // 2, int(pattern[whole], 16)
+        return lambda dest_hash: dest_hash[:at] == head and dest_hash[at] >> 4 == nibble
+    elif mode == MatchMode.SUFFIX:
+        odd = len(pattern) % 2
+        tail = bytes.fromhex(pattern[odd:])
+        if not odd:
+            n = -len(tail)
+            return lambda dest_hash: dest_hash[n:] == tail
+        at, nibble = -len(tail) - 1, int(pattern[0], 16)
+        return lambda dest_hash: dest_hash.endswith(tail) and dest_hash[at] & 0x0F == nibble
+    return lambda dest_hash: matches(dest_hash.hex())
 
 
 def validate_hex_pattern(pattern: str) -> str:
@@ -64,11 +107,18 @@ def validate_hex_pattern(pattern: str) -> str:
     cleaned = pattern.lower().strip()
     if not cleaned:
         raise ValueError("Pattern cannot be empty.")
-    if not all(c in "0123456789abcdef" for c in cleaned):
+    # Parse with int() instead of a per-character scan. int() also accepts
+    # signs, underscores, inner whitespace, a 0x prefix and non-ASCII
+    # digits, so those are ruled out first.
+    try:
+        if not (cleaned.isascii() and cleaned.isalnum()) or "x" in cleaned:
+            raise ValueError
+        int(cleaned, 16)
+    except ValueError:
         raise ValueError(
             f"Pattern '{pattern}' contains non-hex characters. "
             "Only 0-9 and a-f are valid."
-        )
+        ) from None
     if len(cleaned) > 32:
         raise ValueError(
             f"Pattern length {len(cleaned)} exceeds maximum address length of 32 hex chars."
@@ -81,15 +131,20 @@ def estimate_difficulty(pattern: MatchPattern) -> dict:
 
     Returns dict with: expected_attempts, estimated_seconds_per_core, difficulty_description
     """
-    if pattern.mode == MatchMode.PREFIX:
-        expected = 16 ** len(pattern.pattern)
-    elif pattern.mode == MatchMode.SUFFIX:
-        expected = 16 ** len(pattern.pattern)
-    elif pattern.mode == MatchMode.CONTAINS:
-        n = len(pattern.pattern)
-        positions = max(1, 32 - n + 1)
-        expected = (16 ** n) / positions
-    elif pattern.mode == MatchMode.REGEX:
+    return dict(_estimate_difficulty(pattern.mode, len(pattern.pattern)))
+
+
+@functools.lru_cache(maxsize=64)
+def _estimate_difficulty(mode: MatchMode, length: int) -> dict:
+    """Cached estimate; depends only on mode and pattern length."""
+    if mode == MatchMode.PREFIX:
+        expected = 16 ** length
+    elif mode == MatchMode.SUFFIX:
+        expected = 16 ** length
+    elif mode == MatchMode.CONTAINS:
+        positions = max(1, 32 - length + 1)
+        expected = (16 ** length) / positions
+    elif mode == MatchMode.REGEX:
         return {
             "expected_attempts": None,
             "estimated_seconds_per_core": None,
@@ -6,49 +6,149 @@ On macOS/Windows, multiprocessing uses 'spawn' which requires worker
 targets to be importable by name from a module.
 """
 
-from revanity.core import generate_and_hash
-from revanity.matcher import MatchPattern
+import functools
+import hashlib
+import os
+import sys
+import time
+
+from revanity.core import RandomPool, search_batch
+from revanity.matcher import CompiledPattern, MatchPattern
+
+# Layout of the shared RawArray('Q') handed to workers: the first 64-byte
+# cache line holds the stop flag, followed by one cache line (8 x uint64) of
+# keys-checked counter per worker, so workers never write to the same line.
+COUNTER_STRIDE = 8
+STOP_FLAG = 0
+
+
+# Batch sizing: aim for this much work between stop flag checks, so stop
+# latency stays bounded on slow machines and per-batch overhead negligible
+# on fast ones.
+BATCH_SECONDS = 0.02
+MIN_BATCH = 32
+MAX_BATCH = 100_000
+
+
+def counter_slot(worker_index: int) -> int:
+    """Index of a worker's keys-checked counter in the shared array."""
+    return (worker_index + 1) * COUNTER_STRIDE
+
+
+# macOS <pthread/qos.h>: QOS_CLASS_USER_INITIATED keeps a thread eligible
+# for performance cores on Apple Silicon.
+_QOS_CLASS_USER_INITIATED = 0x19
+
+
+def pin_worker(worker_index: int) -> None:
+    """Best-effort placement of this worker process on its own core.
+
+    On Linux, bind to one CPU of the allowed set (worker_index modulo its
+    size) so the scheduler does not migrate the hot loop. On macOS, which
+    has no affinity API, request the user-initiated QoS class instead.
+    Failures are ignored: placement is an optimization only.
+    """
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[worker_index % len(cpus)]})
+        return
+    except (AttributeError, OSError):
+        pass
+
+    if sys.platform == "darwin":
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None)
+            libc.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INITIATED, 0)
+        except (OSError, AttributeError):
+            pass
+
+
+@functools.lru_cache(maxsize=16)
+def compile_pattern(pattern: MatchPattern) -> CompiledPattern:
+    """Compile a pattern once per worker process.
+
+    Pool workers outlive a single search, so repeating a search (or
+    alternating between a few patterns) reuses the compiled matcher.
+    """
+    return pattern.compile()
 
 
 def search_worker(
     name_hash: bytes,
     pattern: MatchPattern,
     result_queue,
-    stop_event,
-    counter,
-    batch_size: int = 500,
+    shared,
+    worker_index: int,
+    batch_size: int = 1024,
 ):
     """Worker process: generate keys in a tight loop and check for matches.
 
-    Runs until a match is found or stop_event is set.
+    Runs until a match is found or the shared stop flag is set.
 
     Args:
         name_hash: Precomputed 10-byte name hash for target destination type.
-        pattern: MatchPattern (will be compiled locally).
-        result_queue: multiprocessing.Queue — push (prv_bytes, id_hash, dest_hex) on match.
-        stop_event: multiprocessing.Event — signals all workers to stop.
-        counter: multiprocessing.Value('Q') — shared total-keys-checked counter.
-        batch_size: Keys to generate between stop_event checks.
+        pattern: MatchPattern (compiled locally, cached per process).
+        result_queue: multiprocessing.Queue — push (prv_bytes, id_hash, dest_hash) on match.
+        shared: multiprocessing.RawArray('Q') — stop flag at STOP_FLAG plus
+            per-worker keys-checked counters (see counter_slot).
+        worker_index: Index of this worker, selecting its counter slot.
+        batch_size: Keys in the first batch; later batches are resized to take
+            about BATCH_SECONDS each from the measured rate.
+    """
+    compiled = compile_pattern(pattern)
+    name_ctx = hashlib.sha256(name_hash)
+    pool = RandomPool()
+    slot = counter_slot(worker_index)
+    total = 0
+
+    # The stop flag is a plain shared-memory load, not an Event syscall
+    while not shared[STOP_FLAG]:
+        t0 = time.perf_counter_ns()
+        checked, hit = search_batch(name_ctx, compiled.matches_bytes, batch_size, pool)
+        elapsed_ns = time.perf_counter_ns() - t0
+
+        # Only this worker writes its slot, so a plain store needs no lock.
+        total += checked
+        shared[slot] = total
+
+        if hit is not None:
+            result_queue.put(hit)
+            shared[STOP_FLAG] = 1
+            return
+
+        if elapsed_ns > 0:
+            rate = checked * 1e9 / elapsed_ns
+            batch_size = min(MAX_BATCH, max(MIN_BATCH, int(rate * BATCH_SECONDS)))
+
+
+def pool_worker(
+    worker_index: int,
+    task_queue,
+    result_queue,
+    shared,
+):
+    """Persistent worker process: run search jobs from task_queue until None.
+
+    Each task is a (name_hash, pattern) tuple searched with search_worker.
+    worker_index is put on result_queue every time a job ends, after any
+    hit from that job, so the parent never sees a job as finished before
+    its hit (one queue keeps one process's puts in order).
+
+    Args:
+        worker_index: Index of this worker, used for its counter slot.
+        task_queue: This worker's own multiprocessing.Queue of jobs; None
+            shuts the worker down.
+        result_queue, shared: As for search_worker; result_queue also
+            receives worker_index (an int) when a job ends.
     """
-    compiled = pattern.compile()
-    local_count = 0
-
-    while not stop_event.is_set():
-        for _ in range(batch_size):
-            prv_bytes, identity_hash, dest_hex = generate_and_hash(name_hash)
-            local_count += 1
-
-            if compiled.matches(dest_hex):
-                result_queue.put((prv_bytes, identity_hash, dest_hex))
-                stop_event.set()
-                with counter.get_lock():
-                    counter.value += local_count
-                return
-
-        with counter.get_lock():
-            counter.value += local_count
-        local_count = 0
-
-    if local_count > 0:
-        with counter.get_lock():
-            counter.value += local_count
+    pin_worker(worker_index)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+        name_hash, pattern = task
+        try:
+            search_worker(name_hash, pattern, result_queue, shared, worker_index)
+        finally:
+            result_queue.put(worker_index)
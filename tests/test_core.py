@@ -0,0 +1,93 @@
+"""Key derivation: search_batch/generate_and_hash against cryptography."""
+
+import hashlib
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from revanity import core
+from revanity.core import (
+    LXMF_NAME_HASH,
+    RandomPool,
+    generate_and_hash,
+    search_batch,
+)
+
+RAW = Encoding.Raw
+RAW_PUB = PublicFormat.Raw
+
+# (HAS_SODIUM_FFI, HAS_NACL) for each search_batch tier
+BACKENDS = [
+    pytest.param(
+        (True, True), id="sodium-ffi",
+        marks=pytest.mark.skipif(not core.HAS_SODIUM_FFI, reason="nacl._sodium unavailable"),
+    ),
+    pytest.param(
+        (False, True), id="nacl-bindings",
+        marks=pytest.mark.skipif(not core.HAS_NACL, reason="PyNaCl unavailable"),
+    ),
+    pytest.param((False, False), id="cryptography"),
+]
+
+
+def reference_hashes(private_key: bytes, name_hash: bytes) -> tuple[bytes, bytes]:
+    """Derive (identity_hash, dest_hash) the way RNS does, via cryptography."""
+    x_pub = X25519PrivateKey.from_private_bytes(private_key[:32]).public_key().public_bytes(RAW, RAW_PUB)
+    e_pub = Ed25519PrivateKey.from_private_bytes(private_key[32:]).public_key().public_bytes(RAW, RAW_PUB)
+    identity_hash = hashlib.sha256(x_pub + e_pub).digest()[:16]
+    dest_hash = hashlib.sha256(name_hash + identity_hash).digest()[:16]
+    return identity_hash, dest_hash
+
+
+@pytest.fixture
+def backend(request, monkeypatch):
+    use_ffi, use_nacl = request.param
+    monkeypatch.setattr(core, "HAS_SODIUM_FFI", use_ffi)
+    monkeypatch.setattr(core, "HAS_NACL", use_nacl)
+
+
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+@pytest.mark.parametrize("hit_at", [1, 2, 7, 50])
+def test_search_batch_matches_reference(backend, hit_at):
+    name_ctx = hashlib.sha256(LXMF_NAME_HASH)
+    seen = []
+
+    def matches(dest_hash):
+        seen.append(bytes(dest_hash))
+        return len(seen) == hit_at
+
+    attempts, hit = search_batch(name_ctx, matches, 64, RandomPool())
+    assert attempts == hit_at
+    private_key, identity_hash, dest_hash = hit
+    assert len(private_key) == 64
+    assert (identity_hash, dest_hash) == reference_hashes(private_key, LXMF_NAME_HASH)
+    assert seen[-1] == dest_hash
+
+
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+def test_search_batch_no_match(backend):
+    name_ctx = hashlib.sha256(LXMF_NAME_HASH)
+    assert search_batch(name_ctx, lambda d: False, 40, RandomPool()) == (40, None)
+
+
+@pytest.mark.parametrize("backend", BACKENDS[1:], indirect=True)
+def test_generate_and_hash_matches_reference(backend):
+    name_ctx = hashlib.sha256(LXMF_NAME_HASH)
+    for _ in range(20):
+        private_key, identity_hash, dest_hash = generate_and_hash(name_ctx)
+        assert (identity_hash, dest_hash) == reference_hashes(private_key, LXMF_NAME_HASH)
+
+
+def test_name_ctx_is_not_consumed():
+    name_ctx = hashlib.sha256(LXMF_NAME_HASH)
+    before = name_ctx.digest()
+    search_batch(name_ctx, lambda d: False, 8, RandomPool())
+    generate_and_hash(name_ctx)
+    assert name_ctx.digest() == before
+
+
+def test_random_pool_take_sizes():
+    pool = RandomPool(chunk=256)
+    assert [len(pool.take(n)) for n in (0, 1, 64, 255, 256, 1000)] == [0, 1, 64, 255, 256, 1000]
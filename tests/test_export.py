@@ -0,0 +1,54 @@
+"""Identity export files."""
+
+import errno
+import os
+import stat
+
+import pytest
+
+from revanity.export import prepare_export, save_identity_file, save_identity_text
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+
+
+@pytest.fixture
+def identity():
+    private_key = os.urandom(64)
+    return private_key, prepare_export(private_key, os.urandom(16), "lxmf.delivery")
+
+
+@posix_only
+def test_files_are_owner_only(tmp_path, identity):
+    """New files and overwritten world-readable ones both end up 0o600."""
+    private_key, export = identity
+    existing = [tmp_path / "old.identity", tmp_path / "old.txt"]
+    for path in existing:
+        path.write_bytes(b"x")
+        path.chmod(0o644)
+
+    for stem in ("new", "old"):
+        save_identity_file(private_key, str(tmp_path / f"{stem}.identity"))
+        save_identity_text(export, str(tmp_path / f"{stem}.txt"))
+    for path in tmp_path.iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600, path.name
+    assert (tmp_path / "old.identity").read_bytes() == private_key
+
+
+@posix_only
+def test_failing_fchmod_still_writes(tmp_path, identity, monkeypatch):
+    """Filesystems that reject chmod must not leave a truncated key file."""
+    private_key, export = identity
+    identity_path = tmp_path / "usb.identity"
+    text_path = tmp_path / "usb.txt"
+    identity_path.write_bytes(b"previous key")
+    text_path.write_text("previous text")
+
+    def fchmod(fd, mode):
+        raise PermissionError(errno.EPERM, "Operation not permitted")
+
+    monkeypatch.setattr(os, "fchmod", fchmod)
+    save_identity_file(private_key, str(identity_path))
+    save_identity_text(export, str(text_path))
+
+    assert identity_path.read_bytes() == private_key
+    assert export.private_key_hex in text_path.read_text()
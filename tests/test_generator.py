@@ -0,0 +1,128 @@
+"""Worker pool lifecycle: results, stop, reuse, respawn and dead workers."""
+
+import os
+import signal
+import time
+
+import pytest
+
+from revanity import generator as gen_module
+from revanity.generator import VanityGenerator
+from revanity.matcher import MatchMode
+from revanity.worker import STOP_FLAG
+
+# Effectively never matches, so a search runs until it is stopped
+NEVER = "ffffffffffff"
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    """Give every test its own pool and shut it down afterwards."""
+    if gen_module._pool is not None:
+        gen_module._discard_pool(gen_module._pool)
+    yield
+    if gen_module._pool is not None:
+        gen_module._discard_pool(gen_module._pool)
+
+
+def wait_until_running(gen, timeout=5.0):
+    """Wait until every worker has checked at least one key."""
+    deadline = time.time() + timeout
+    pool = gen._pool
+    while time.time() < deadline:
+        counters = pool.shared[gen_module.COUNTER_STRIDE::gen_module.COUNTER_STRIDE]
+        if all(counters):
+            return
+        time.sleep(0.01)
+    raise AssertionError("workers did not start")
+
+
+def poll_until_done(gen, timeout):
+    deadline = time.time() + timeout
+    while gen.is_running:
+        assert time.time() < deadline, "search did not finish"
+        gen.poll()
+        time.sleep(0.01)
+
+
+def worker_pids(gen):
+    return [w.pid for w in gen._pool._workers]
+
+
+@pytest.mark.parametrize("pattern", ["a", "b7"])
+def test_run_blocking_returns_matching_hits(pattern):
+    gen = VanityGenerator(pattern, MatchMode.PREFIX, num_workers=2)
+    results = gen.run_blocking(progress_interval=0.01)
+    assert results
+    for result in results:
+        assert result.dest_hash_hex.startswith(pattern)
+        assert len(result.private_key) == 64
+    assert not gen.is_running
+
+
+def test_stop_is_prompt_and_pool_is_reused():
+    gen = VanityGenerator(NEVER, num_workers=2)
+    gen.start()
+    wait_until_running(gen)
+    pids = worker_pids(gen)
+
+    t0 = time.time()
+    assert gen.stop() == []
+    assert time.time() - t0 < 1.0
+    assert not gen.is_running
+
+    again = VanityGenerator("a", num_workers=2)
+    again.start()
+    assert worker_pids(again) == pids
+    poll_until_done(again, timeout=10)
+    assert again.results
+
+
+def test_stale_stop_takes_no_hits_from_newer_job():
+    old = VanityGenerator(NEVER, num_workers=2)
+    old.start()
+    old.stop()
+
+    new = VanityGenerator("a", num_workers=2)
+    new.start()
+    deadline = time.time() + 10
+    while not new._pool.is_idle():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+    assert old.stop() == []
+    poll_until_done(new, timeout=5)
+    assert new.results
+    assert all(r.dest_hash_hex.startswith("a") for r in new.stop())
+
+
+def test_changing_num_workers_respawns_pool():
+    first = VanityGenerator("a", num_workers=1)
+    first.run_blocking(progress_interval=0.01)
+    pids = worker_pids(first)
+
+    second = VanityGenerator("a", num_workers=2)
+    second.start()
+    assert len(worker_pids(second)) == 2
+    assert not set(worker_pids(second)) & set(pids)
+    poll_until_done(second, timeout=10)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="needs SIGKILL")
+def test_killed_worker_does_not_hang_the_search():
+    gen = VanityGenerator(NEVER, num_workers=3)
+    gen.start()
+    wait_until_running(gen)
+    os.kill(worker_pids(gen)[0], signal.SIGKILL)
+    gen._pool._workers[0].join(timeout=5)
+
+    # What a surviving worker does when it finds a match
+    gen._pool.shared[STOP_FLAG] = 1
+    poll_until_done(gen, timeout=5)
+
+    # The broken pool is replaced rather than reported as busy
+    after = VanityGenerator("a", num_workers=3)
+    after.start()
+    assert after._pool is not gen._pool
+    poll_until_done(after, timeout=10)
+    assert after.results
@@ -0,0 +1,45 @@
+"""Stats line formatting in the GUI."""
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from revanity.gui import ReVanityApp  # noqa: E402
+
+format_time = ReVanityApp._format_time
+format_rate = ReVanityApp._format_rate
+
+
+@pytest.mark.parametrize("seconds, expected", [
+    (0, "0ms"),
+    (0.0004, "0ms"),
+    (0.9994, "999ms"),
+    (0.9996, "1000ms"),
+    (1, "1.0s"),
+    (59.94, "59.9s"),
+    (59.99, "60.0s"),
+    (60, "1.0m"),
+    (111, "1.9m"),
+    (207, "3.5m"),
+    (3599, "60.0m"),
+    (3600, "1.0h"),
+    (86399, "24.0h"),
+    (86400, "1.0d"),
+    (10 ** 9, "11574.1d"),
+])
+def test_format_time(seconds, expected):
+    assert format_time(seconds) == expected
+
+
+@pytest.mark.parametrize("rate, expected", [
+    (0, "0"),
+    (999, "999"),
+    (999.6, "1000"),
+    (1000, "1.0K"),
+    (12345, "12.3K"),
+    (999_999, "1000.0K"),
+    (1_000_000, "1.00M"),
+    (33_000_000, "33.00M"),
+])
+def test_format_rate(rate, expected):
+    assert format_rate(rate) == expected
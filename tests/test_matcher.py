@@ -0,0 +1,93 @@
+"""Byte matchers against the hex matchers, and hex pattern validation."""
+
+import os
+import random
+import re
+
+import pytest
+
+from revanity.matcher import MatchMode, MatchPattern, validate_hex_pattern
+
+HEX = "0123456789abcdef"
+
+
+def candidate_hashes(pattern: str, rng: random.Random) -> list[bytes]:
+    """Random 16-byte hashes plus ones that contain or nearly contain pattern."""
+    hashes = [os.urandom(16) for _ in range(50)]
+    n = len(pattern)
+    for at in {0, 32 - n, rng.randrange(0, 33 - n)}:
+        base = list(os.urandom(16).hex())
+        base[at:at + n] = pattern
+        hashes.append(bytes.fromhex("".join(base)))
+        # Same placement with one nibble changed, to catch off-by-one slices
+        flip = at + rng.randrange(n)
+        base[flip] = HEX[(HEX.index(base[flip]) + 1) % 16]
+        hashes.append(bytes.fromhex("".join(base)))
+    return hashes
+
+
+@pytest.mark.parametrize("mode", list(MatchMode))
+@pytest.mark.parametrize("length", range(1, 33))
+def test_matches_bytes_agrees_with_hex(mode, length):
+    rng = random.Random(length * 31 + len(mode.value))
+    for _ in range(3):
+        pattern = "".join(rng.choice(HEX) for _ in range(length))
+        compiled = MatchPattern(mode=mode, pattern=pattern).compile()
+        for dest_hash in candidate_hashes(pattern, rng):
+            assert compiled.matches_bytes(dest_hash) == compiled.matches(dest_hash.hex()), (
+                mode, pattern, dest_hash.hex(),
+            )
+
+
+def reference_validate(pattern: str) -> str:
+    """The original per-character validate_hex_pattern."""
+    cleaned = pattern.lower().strip()
+    if not cleaned:
+        raise ValueError("Pattern cannot be empty.")
+    if not all(c in "0123456789abcdef" for c in cleaned):
+        raise ValueError(
+            f"Pattern '{pattern}' contains non-hex characters. "
+            "Only 0-9 and a-f are valid."
+        )
+    if len(cleaned) > 32:
+        raise ValueError(
+            f"Pattern length {len(cleaned)} exceeds maximum address length of 32 hex chars."
+        )
+    return cleaned
+
+
+def outcome(func, pattern):
+    try:
+        return func(pattern)
+    except ValueError as e:
+        return ("error", str(e))
+
+
+@pytest.mark.parametrize("pattern", [
+    "dead", "DEAD", "  cafe  ", "0", "f" * 32, "f" * 33, "",
+    "   ", "0x1f", "0X1F", "x", "-1", "+1", "1_000", "de ad", "dead\n",
+    "١٢", "１", "g", "deadbeefz", "abc\t", "é",
+])
+def test_validate_hex_pattern_matches_reference(pattern):
+    assert outcome(validate_hex_pattern, pattern) == outcome(reference_validate, pattern)
+
+
+def test_validate_hex_pattern_every_ascii_char():
+    for code in range(128):
+        for pattern in (chr(code), f"a{chr(code)}b"):
+            assert outcome(validate_hex_pattern, pattern) == outcome(reference_validate, pattern)
+
+
+@pytest.mark.parametrize("case_sensitive", [True, False])
+@pytest.mark.parametrize("regex", [
+    r"^dead", r"^(dead|beef)", r"a.c", r"(de|ad){2}f", r"(.)\1\1", r"^[A-F]{2}",
+])
+def test_regex_matches_agrees_with_re(regex, case_sensitive):
+    flags = 0 if case_sensitive else re.IGNORECASE
+    expected = re.compile(regex, flags)
+    compiled = MatchPattern(MatchMode.REGEX, regex, case_sensitive).compile()
+    samples = [os.urandom(16).hex() for _ in range(200)]
+    samples += ["dead" + s[4:] for s in samples[:20]] + ["ab" + "c" * 30, "aaa" + "0" * 29]
+    samples += [s.upper() for s in samples[:20]]
+    for hex_addr in samples:
+        assert compiled.matches(hex_addr) == bool(expected.search(hex_addr)), hex_addr